@@ -11,9 +11,19 @@ from helm_preview.diff.engine import ChangeRecord
 
 
 class RiskLevel(Enum):
-    SAFE = "safe"
-    WARNING = "warning"
-    DANGER = "danger"
+    """Risk severity. value is the serialized name; rank orders levels."""
+
+    SAFE = "safe", 0
+    WARNING = "warning", 1
+    DANGER = "danger", 2
+
+    rank: int
+
+    def __new__(cls, value: str, rank: int) -> RiskLevel:
+        member = object.__new__(cls)
+        member._value_ = value
+        member.rank = rank
+        return member
 
 
 @dataclass
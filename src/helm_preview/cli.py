@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import click
-import yaml
 
 from helm_preview.analysis.ownership import OwnershipInfo, detect_ownership
 from helm_preview.analysis.risk import RiskAnnotation, assess_risk
+from helm_preview.config import DEFAULT_TIMEOUT
 from helm_preview.core.helm import dry_run_upgrade, get_manifest
 from helm_preview.core.kubectl import server_side_dry_run
 from helm_preview.core.runner import RunError
+from helm_preview.core.yaml_io import safe_dump, safe_dump_all
+from helm_preview.crd.extraction import CRD_KIND
 from helm_preview.diff.engine import ChangeRecord, diff_all
 from helm_preview.output.json_out import render_json
 from helm_preview.output.terminal import render_terminal
 from helm_preview.parser.manifest import (
     Resource,
     ResourcePair,
+    expand_lists,
     parse_multi_doc,
     pair_resources,
 )
@@ -37,6 +42,15 @@ def main() -> None:
 @click.option("--set", "set_values", multiple=True, help="Set values (key=val)")
 @click.option("--version", default=None, help="Chart version")
 @click.option("--server-side", is_flag=True, help="Truth-diff via server-side dry-run")
+@click.option(
+    "--ssd-concurrency",
+    default=8,
+    type=click.IntRange(min=1),
+    help=(
+        "Parallel kubectl calls when --server-side falls back to per-resource "
+        "dry-runs; also sizes the batch timeout (default: 8)"
+    ),
+)
 @click.option("--show-all", is_flag=True, help="Disable noise filtering")
 @click.option(
     "-o", "--output", "output_format",
@@ -65,6 +79,7 @@ def diff(
     set_values: tuple[str, ...],
     version: str | None,
     server_side: bool,
+    ssd_concurrency: int,
     show_all: bool,
     output_format: str,
     context: int,
@@ -100,7 +115,9 @@ def diff(
 
         # 3. Optional: server-side dry-run
         if server_side:
-            upgrade_resources = _apply_server_side(upgrade_resources, ns, **kube_opts)
+            upgrade_resources = _apply_server_side(
+                upgrade_resources, ns, concurrency=ssd_concurrency, **kube_opts
+            )
 
         # 4. Parse & pair
         pairs = pair_resources(live_resources, upgrade_resources)
@@ -125,9 +142,11 @@ def diff(
         # 7. Risk analysis + ownership
         risk_results = assess_risk(change_records)
         full_results: list[tuple[ChangeRecord, list[RiskAnnotation], OwnershipInfo | None]] = []
+        new_by_key = _index_by_key(upgrade_resources)
+        old_by_key = _index_by_key(live_resources)
         for change, risk_annotations in risk_results:
             # Detect ownership from the new resource (or old if removed)
-            resource = _find_resource(change, live_resources, upgrade_resources)
+            resource = new_by_key.get(change.resource_key) or old_by_key.get(change.resource_key)
             ownership = detect_ownership(resource) if resource else None
             full_results.append((change, risk_annotations, ownership))
 
@@ -161,7 +180,7 @@ def diff(
 def _is_crd_pair(pair: ResourcePair) -> bool:
     """Check if a resource pair involves a CRD."""
     res = pair.new or pair.old
-    return res is not None and res.kind == "CustomResourceDefinition"
+    return res is not None and res.kind == CRD_KIND
 
 
 def _run_crd_analysis(
@@ -172,9 +191,12 @@ def _run_crd_analysis(
     **kube_opts: str | None,
 ) -> "CrdReport":
     """Run the CRD analysis pipeline."""
+    from helm_preview.crd.discovery import invalidate_cache
     from helm_preview.crd.pipeline import run_crd_pipeline
     from helm_preview.crd.policy import CrdPolicyMode
 
+    # Each invocation must see the cluster as it is now
+    invalidate_cache()
     policy_mode = CrdPolicyMode(crd_policy)
     return run_crd_pipeline(
         upgrade_resources=upgrade_resources,
@@ -186,37 +208,72 @@ def _run_crd_analysis(
 
 
 def _apply_server_side(
-    resources: list[Resource], namespace: str, **kube_opts: str | None
+    resources: list[Resource],
+    namespace: str,
+    concurrency: int = 8,
+    **kube_opts: str | None,
 ) -> list[Resource]:
-    """Apply server-side dry-run to each resource for truth-diff mode."""
-    results: list[Resource] = []
-    for res in resources:
+    """Apply server-side dry-run to all resources for truth-diff mode.
+
+    Sends every resource in one multi-document kubectl call and pairs the
+    results back by resource key; resources missing from the response keep
+    their original body. If kubectl rejects the batch (e.g. one resource
+    fails admission) or times out, falls back to per-resource calls.
+    """
+    if not resources:
+        return []
+
+    # Same wall-clock budget as the per-resource calls on the thread pool
+    rounds = -(-len(resources) // max(concurrency, 1))
+    try:
+        mutated_yaml = server_side_dry_run(
+            safe_dump_all([res.body for res in resources]),
+            namespace,
+            timeout=DEFAULT_TIMEOUT * rounds,
+            **kube_opts,
+        )
+    except (RunError, subprocess.TimeoutExpired):
+        return _apply_server_side_each(
+            resources, namespace, concurrency=concurrency, **kube_opts
+        )
+
+    mutated = expand_lists(
+        parse_multi_doc(mutated_yaml, default_namespace=namespace),
+        default_namespace=namespace,
+    )
+    mutated_by_key = {res.key: res for res in mutated}
+    return [mutated_by_key.get(res.key, res) for res in resources]
+
+
+def _apply_server_side_each(
+    resources: list[Resource],
+    namespace: str,
+    concurrency: int = 8,
+    **kube_opts: str | None,
+) -> list[Resource]:
+    """Apply server-side dry-run one resource per kubectl call.
+
+    Each resource is an independent kubectl round-trip, so calls run on a
+    thread pool. Results keep the input order.
+    """
+    def apply_one(res: Resource) -> Resource:
         try:
             mutated_yaml = server_side_dry_run(
-                yaml.dump(res.body), namespace, **kube_opts
+                safe_dump(res.body), namespace, **kube_opts
             )
-            mutated = parse_multi_doc(mutated_yaml, default_namespace=namespace)
-            if mutated:
-                results.append(mutated[0])
-            else:
-                results.append(res)
-        except RunError:
+        except (RunError, subprocess.TimeoutExpired):
             # If server-side dry-run fails for a resource, use the original
-            results.append(res)
-    return results
-
-
-def _find_resource(
-    change: ChangeRecord,
-    old_resources: list[Resource],
-    new_resources: list[Resource],
-) -> Resource | None:
-    """Find the Resource object for a change record."""
-    # Prefer new resource, fall back to old
-    for res in new_resources:
-        if res.key == change.resource_key:
             return res
-    for res in old_resources:
-        if res.key == change.resource_key:
-            return res
-    return None
+        mutated = parse_multi_doc(mutated_yaml, default_namespace=namespace)
+        return mutated[0] if mutated else res
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(resources))) as pool:
+        return list(pool.map(apply_one, resources))
+
+
+def _index_by_key(resources: list[Resource]) -> dict[str, Resource]:
+    """Map resource key -> Resource, keeping the first of any duplicates."""
+    index: dict[str, Resource] = {}
+    for res in resources:
+        index.setdefault(res.key, res)
+    return index
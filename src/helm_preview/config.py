@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 # Dot-paths to strip before diffing. Supports glob on leaf keys via fnmatch.
 NOISE_PATHS: set[str] = {
     "metadata.creationTimestamp",
@@ -40,3 +42,8 @@ DEFAULT_TIMEOUT = 60
 
 # Default context lines for diff output
 DEFAULT_CONTEXT_LINES = 3
+
+# Read-only defaults for missing/null keys in `(d.get(k) or EMPTY_MAPPING)`
+# chains, so lookups don't allocate a fresh {} or [] each time
+EMPTY_MAPPING = MappingProxyType({})
+EMPTY_SEQUENCE: tuple = ()
@@ -0,0 +1,106 @@
+"""Talk to the Kubernetes API directly via the optional `kubernetes` client."""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from typing import Any
+
+try:
+    import kubernetes
+except ImportError:  # optional dependency (pip install helm-preview[kube])
+    kubernetes = None
+
+from helm_preview.config import DEFAULT_TIMEOUT
+
+# Set to 1 to always shell out to kubectl, even if the client is installed.
+USE_KUBECTL_ENV = "HELM_PREVIEW_USE_KUBECTL"
+
+
+class ClientError(Exception):
+    """Raised when the Kubernetes API cannot be reached or rejects a request."""
+
+
+def enabled() -> bool:
+    """True if the client is installed and kubectl is not forced."""
+    return kubernetes is not None and os.environ.get(USE_KUBECTL_ENV) != "1"
+
+
+def list_crds(**kube_opts: str | None) -> list[dict]:
+    """List all CRDs as API JSON bodies (camelCase keys, as kubectl prints them)."""
+    def call(api_client: Any) -> Any:
+        api = kubernetes.client.ApiextensionsV1Api(api_client)
+        return api.list_custom_resource_definition(
+            _preload_content=False, _request_timeout=DEFAULT_TIMEOUT
+        )
+
+    items = _list_items(call, **kube_opts)
+    # List items from the API omit their type; kubectl fills it in
+    for item in items:
+        item.setdefault("apiVersion", "apiextensions.k8s.io/v1")
+        item.setdefault("kind", "CustomResourceDefinition")
+    return items
+
+
+def list_custom_objects(
+    plural: str, group: str, **kube_opts: str | None
+) -> list[dict]:
+    """List all instances of a CR across namespaces, at the group's preferred version.
+
+    Returns an empty list if the group is not served.
+    """
+    def call(api_client: Any) -> Any:
+        version = _preferred_versions(api_client).get(group)
+        if version is None:
+            return None
+        api = kubernetes.client.CustomObjectsApi(api_client)
+        return api.list_cluster_custom_object(
+            group, version, plural,
+            _preload_content=False, _request_timeout=DEFAULT_TIMEOUT,
+        )
+
+    return _list_items(call, **kube_opts)
+
+
+def invalidate_cache() -> None:
+    """Drop cached API clients and discovery data."""
+    _api_client.cache_clear()
+    _preferred_versions.cache_clear()
+
+
+def _list_items(call: Any, **kube_opts: str | None) -> list[dict]:
+    try:
+        api_client = _api_client(kube_opts.get("kubeconfig"), kube_opts.get("kube_context"))
+        # Raw response: skips the client's model deserialization and keeps
+        # the API's own field names
+        response = call(api_client)
+        if response is None:
+            return []
+        data = json.loads(response.data)
+    except Exception as e:  # config, transport and API errors alike
+        raise ClientError(str(e)) from e
+    return data.get("items") or []
+
+
+@functools.lru_cache(maxsize=8)
+def _api_client(kubeconfig: str | None, kube_context: str | None) -> Any:
+    """One API client (and connection pool) per kubeconfig/context."""
+    return kubernetes.config.new_client_from_config(
+        config_file=kubeconfig, context=kube_context
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _preferred_versions(api_client: Any) -> dict[str, str]:
+    """API group name -> preferred version, from /apis discovery."""
+    api = kubernetes.client.ApisApi(api_client)
+    response = api.get_api_versions(
+        _preload_content=False, _request_timeout=DEFAULT_TIMEOUT
+    )
+    data = json.loads(response.data)
+    return {
+        g["name"]: g["preferredVersion"]["version"]
+        for g in data.get("groups", [])
+        if g.get("preferredVersion")
+    }
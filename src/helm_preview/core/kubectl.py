@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from helm_preview.config import DEFAULT_TIMEOUT
 from helm_preview.core.runner import run
 
 
@@ -16,11 +17,15 @@ def _kube_flags(**kube_opts: str | None) -> list[str]:
 
 
 def server_side_dry_run(
-    manifest_yaml: str, namespace: str, **kube_opts: str | None
+    manifest_yaml: str,
+    namespace: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    **kube_opts: str | None,
 ) -> str:
     """kubectl apply --dry-run=server -o yaml -f - -> post-mutation YAML.
 
-    Feeds single-resource YAML via stdin.
+    Feeds YAML via stdin. A multi-document stream is applied in a single
+    call; kubectl then prints the results as one `kind: List` document.
     """
     cmd = [
         "kubectl", "apply",
@@ -30,4 +35,4 @@ def server_side_dry_run(
         "-f", "-",
     ]
     cmd += _kube_flags(**kube_opts)
-    return run(cmd, stdin=manifest_yaml)
+    return run(cmd, timeout=timeout, stdin=manifest_yaml)
@@ -0,0 +1,71 @@
+"""YAML load/dump helpers backed by libyaml when available."""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import Any, Callable
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+# Opt-in alternative parser backend (e.g. HELM_PREVIEW_YAML_BACKEND=yaml_rs).
+BACKEND_ENV = "HELM_PREVIEW_YAML_BACKEND"
+
+
+def _yaml_rs_loader() -> Callable[[str], Any]:
+    import yaml_rs
+
+    return yaml_rs.loads
+
+
+# Backend name -> factory returning a str -> object loader. Factories
+# raise ImportError when the backend is not installed.
+_BACKENDS: dict[str, Callable[[], Callable[[str], Any]]] = {
+    "yaml_rs": _yaml_rs_loader,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _backend_loader(name: str) -> Callable[[str], Any] | None:
+    """Resolve a backend by name, or None if unknown or not installed."""
+    factory = _BACKENDS.get(name)
+    if factory is None:
+        return None
+    try:
+        return factory()
+    except ImportError:
+        return None
+
+
+def safe_load(text: str) -> Any:
+    """Parse a single YAML document with the fastest available safe loader.
+
+    If HELM_PREVIEW_YAML_BACKEND names an installed backend it is tried
+    first; any failure falls back to PyYAML so callers keep seeing
+    yaml.YAMLError for malformed input.
+    """
+    backend = os.environ.get(BACKEND_ENV)
+    if backend:
+        loader = _backend_loader(backend.strip().lower())
+        if loader is not None:
+            try:
+                return loader(text)
+            except Exception:
+                pass
+    return yaml.load(text, Loader=SafeLoader)
+
+
+def safe_dump(data: Any) -> str:
+    """Serialize data to YAML with the fastest available safe dumper."""
+    return yaml.dump(data, Dumper=SafeDumper)
+
+
+def safe_dump_all(documents: list[Any]) -> str:
+    """Serialize documents as a multi-document YAML stream."""
+    return yaml.dump_all(documents, Dumper=SafeDumper)
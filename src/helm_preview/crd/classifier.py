@@ -7,123 +7,109 @@ import re
 from helm_preview.analysis.risk import RiskAnnotation, RiskLevel
 from helm_preview.diff.engine import FieldChange
 
+_ADDED = frozenset({"item_added"})
+_REMOVED = frozenset({"item_removed"})
+_VALUE = frozenset({"value_changed"})
 
-def classify_crd_changes(changes: list[FieldChange]) -> list[RiskAnnotation]:
-    """Apply graduated risk classification to each CRD field change.
-
-    Returns a RiskAnnotation per change based on path pattern matching.
-    """
-    annotations: list[RiskAnnotation] = []
-    for fc in changes:
-        annotation = _classify_single(fc)
-        annotations.append(annotation)
-    return annotations
-
-
-def _classify_single(fc: FieldChange) -> RiskAnnotation:
-    """Classify a single FieldChange against the CRD path rules."""
-    path = fc.path
-    change_type = fc.change_type
+# Ordered rule table: (path pattern, applicable change types or None for any,
+# level, rule name, message template). The first matching rule wins.
+# Templates may reference {path}, {old} and {new}.
+_Rule = tuple[re.Pattern[str], "frozenset[str] | None", RiskLevel, str, str]
 
+_RULES: list[_Rule] = [
     # --- SAFE patterns ---
-
     # Metadata annotations/labels changes
-    if re.match(r"^metadata\.(annotations|labels)\.", path):
-        return _annotation(RiskLevel.SAFE, "crd_metadata_change",
-                           f"Metadata change at '{path}'", path)
-
+    (re.compile(r"^metadata\.(annotations|labels)\."), None,
+     RiskLevel.SAFE, "crd_metadata_change", "Metadata change at '{path}'"),
     # Additional printer columns (cosmetic)
-    if re.search(r"spec\.versions\[\d+\]\.additionalPrinterColumns", path):
-        return _annotation(RiskLevel.SAFE, "crd_printer_columns",
-                           f"Printer column change at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.additionalPrinterColumns"), None,
+     RiskLevel.SAFE, "crd_printer_columns", "Printer column change at '{path}'"),
     # New version added (whole entry added to spec.versions)
-    if re.match(r"^spec\.versions\[\d+\]$", path) and change_type == "item_added":
-        return _annotation(RiskLevel.SAFE, "crd_version_added",
-                           "New CRD version added", path)
-
-    # New optional property added deep in schema
-    if (re.search(r"spec\.versions\[\d+\]\.schema\.openAPIV3Schema\.properties\.\w+\.properties\.\w+", path)
-            and change_type == "item_added"
-            and not re.search(r"\.required", path)):
-        return _annotation(RiskLevel.SAFE, "crd_optional_property_added",
-                           f"New optional property added at '{path}'", path)
+    (re.compile(r"^spec\.versions\[\d+\]$"), _ADDED,
+     RiskLevel.SAFE, "crd_version_added", "New CRD version added"),
+    # New optional property added deep in schema (not under a .required list)
+    (re.compile(r"^(?!.*\.required).*spec\.versions\[\d+\]\.schema\.openAPIV3Schema"
+                r"\.properties\.\w+\.properties\.\w+"), _ADDED,
+     RiskLevel.SAFE, "crd_optional_property_added", "New optional property added at '{path}'"),
 
     # --- DANGER patterns ---
-
     # Removed version (whole entry removed from spec.versions)
-    if re.match(r"^spec\.versions\[\d+\]$", path) and change_type == "item_removed":
-        return _annotation(RiskLevel.DANGER, "crd_version_removed",
-                           "CRD version removed", path)
-
+    (re.compile(r"^spec\.versions\[\d+\]$"), _REMOVED,
+     RiskLevel.DANGER, "crd_version_removed", "CRD version removed"),
     # New required field added
-    if (re.search(r"spec\.versions\[\d+\]\.schema\..*\.required", path)
-            and change_type == "item_added"):
-        return _annotation(RiskLevel.DANGER, "crd_required_field_added",
-                           f"New required field added at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.required"), _ADDED,
+     RiskLevel.DANGER, "crd_required_field_added", "New required field added at '{path}'"),
     # Property removed from schema
-    if (re.search(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+$", path)
-            and change_type == "item_removed"):
-        return _annotation(RiskLevel.DANGER, "crd_property_removed",
-                           f"Schema property removed at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+$"), _REMOVED,
+     RiskLevel.DANGER, "crd_property_removed", "Schema property removed at '{path}'"),
     # Type changed
-    if (re.search(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.type$", path)
-            and change_type == "value_changed"):
-        return _annotation(RiskLevel.DANGER, "crd_type_changed",
-                           f"Property type changed at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.type$"), _VALUE,
+     RiskLevel.DANGER, "crd_type_changed", "Property type changed at '{path}'"),
     # Scope changed
-    if path == "spec.scope" and change_type == "value_changed":
-        return _annotation(RiskLevel.DANGER, "crd_scope_changed",
-                           f"CRD scope changed from '{fc.old_value}' to '{fc.new_value}'",
-                           path)
-
+    (re.compile(r"^spec\.scope$"), _VALUE,
+     RiskLevel.DANGER, "crd_scope_changed", "CRD scope changed from '{old}' to '{new}'"),
     # Conversion strategy changed
-    if path == "spec.conversion.strategy" and change_type == "value_changed":
-        return _annotation(RiskLevel.DANGER, "crd_conversion_strategy_changed",
-                           f"Conversion strategy changed from '{fc.old_value}' to '{fc.new_value}'",
-                           path)
+    (re.compile(r"^spec\.conversion\.strategy$"), _VALUE,
+     RiskLevel.DANGER, "crd_conversion_strategy_changed",
+     "Conversion strategy changed from '{old}' to '{new}'"),
 
     # --- WARNING patterns ---
-
     # Default value changed
-    if (re.search(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.default$", path)
-            and change_type == "value_changed"):
-        return _annotation(RiskLevel.WARNING, "crd_default_changed",
-                           f"Default value changed at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.default$"), _VALUE,
+     RiskLevel.WARNING, "crd_default_changed", "Default value changed at '{path}'"),
     # Pattern changed (tighter validation)
-    if (re.search(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.pattern$", path)
-            and change_type == "value_changed"):
-        return _annotation(RiskLevel.WARNING, "crd_pattern_changed",
-                           f"Validation pattern changed at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.pattern$"), _VALUE,
+     RiskLevel.WARNING, "crd_pattern_changed", "Validation pattern changed at '{path}'"),
     # Min/max range changed
-    if (re.search(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.(minimum|maximum)$", path)
-            and change_type == "value_changed"):
-        return _annotation(RiskLevel.WARNING, "crd_range_changed",
-                           f"Validation range changed at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.(minimum|maximum)$"), _VALUE,
+     RiskLevel.WARNING, "crd_range_changed", "Validation range changed at '{path}'"),
     # Enum changed
-    if re.search(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.enum", path):
-        return _annotation(RiskLevel.WARNING, "crd_enum_changed",
-                           f"Enum values changed at '{path}'", path)
-
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.properties\.\w+\.enum"), None,
+     RiskLevel.WARNING, "crd_enum_changed", "Enum values changed at '{path}'"),
     # Webhook config changed
-    if re.search(r"^spec\.conversion\.webhook\.", path):
-        return _annotation(RiskLevel.WARNING, "crd_webhook_changed",
-                           f"Conversion webhook configuration changed at '{path}'", path)
-
-    # Required field value changed (not added/removed, but list value changed)
-    if re.search(r"spec\.versions\[\d+\]\.schema\..*\.required", path):
-        if change_type == "item_removed":
-            return _annotation(RiskLevel.SAFE, "crd_required_field_removed",
-                               f"Required field constraint removed at '{path}'", path)
-        if change_type == "value_changed":
-            return _annotation(RiskLevel.DANGER, "crd_required_changed",
-                               f"Required fields changed at '{path}'", path)
+    (re.compile(r"^spec\.conversion\.webhook\."), None,
+     RiskLevel.WARNING, "crd_webhook_changed",
+     "Conversion webhook configuration changed at '{path}'"),
+
+    # Required field list changed in place (added entries are handled above)
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.required"), _REMOVED,
+     RiskLevel.SAFE, "crd_required_field_removed", "Required field constraint removed at '{path}'"),
+    (re.compile(r"spec\.versions\[\d+\]\.schema\..*\.required"), _VALUE,
+     RiskLevel.DANGER, "crd_required_changed", "Required fields changed at '{path}'"),
+]
+
+# Rules that can match paths outside spec.versions[...]
+_GENERAL_RULES = [r for r in _RULES if "versions" not in r[0].pattern]
+
+
+def classify_crd_changes(changes: list[FieldChange]) -> list[RiskAnnotation]:
+    """Apply graduated risk classification to each CRD field change.
+
+    Returns a RiskAnnotation per change based on path pattern matching.
+    """
+    annotations: list[RiskAnnotation] = []
+    for fc in changes:
+        annotation = _classify_single(fc)
+        annotations.append(annotation)
+    return annotations
+
+
+def _classify_single(fc: FieldChange) -> RiskAnnotation:
+    """Classify a single FieldChange against the CRD path rules."""
+    path = fc.path
+    change_type = fc.change_type
+
+    if "spec.versions[" in path:
+        rules = _RULES
+    else:
+        # Every version rule requires a literal 'spec.versions[' in the path
+        rules = _GENERAL_RULES
+    for pattern, change_types, level, rule, template in rules:
+        if change_types is not None and change_type not in change_types:
+            continue
+        if pattern.search(path):
+            message = template.format(path=path, old=fc.old_value, new=fc.new_value)
+            return _annotation(level, rule, message, path)
 
     # Catch-all for any other CRD change
     return _annotation(RiskLevel.WARNING, "crd_unknown_change",
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-from helm_preview.diff.engine import FieldChange, _deepdiff_path_to_dot, _extract_changes
-from helm_preview.diff.filters import normalize_body, strip_noise
-from helm_preview.diff.semantic import is_semantically_equal
+from helm_preview.config import NOISE_PATHS
+from helm_preview.diff.engine import FieldChange, prepare_and_compare
+from helm_preview.diff.filters import compile_noise_paths
 from helm_preview.parser.manifest import Resource, ResourcePair
 
-from deepdiff import DeepDiff
-
 # Additional noise paths specific to CRDs (status, timestamps, etc.)
 CRD_NOISE_PATHS = [
     "status",
@@ -22,6 +20,9 @@ CRD_NOISE_PATHS = [
     "metadata.labels.helm\\.sh/chart",
 ]
 
+# Default plus CRD noise paths, parsed once
+CRD_NOISE_COMPILED = compile_noise_paths(NOISE_PATHS | set(CRD_NOISE_PATHS))
+
 
 def pair_crds(
     installed: list[Resource], proposed: list[Resource]
@@ -33,10 +34,9 @@ def pair_crds(
     old_map = {r.name: r for r in installed}
     new_map = {r.name: r for r in proposed}
 
-    all_names = list(dict.fromkeys(list(old_map.keys()) + list(new_map.keys())))
-
     pairs: list[ResourcePair] = []
-    for name in all_names:
+    # Installed names first, then new ones, each in input order
+    for name in {**old_map, **new_map}:
         old_res = old_map.get(name)
         new_res = new_map.get(name)
 
@@ -68,18 +68,12 @@ def diff_crds(pairs: list[ResourcePair]) -> list[tuple[ResourcePair, list[FieldC
             continue
 
         assert pair.old is not None and pair.new is not None
-        old_body = strip_noise(pair.old.body, CRD_NOISE_PATHS)
-        new_body = strip_noise(pair.new.body, CRD_NOISE_PATHS)
-
-        old_body = normalize_body(old_body)
-        new_body = normalize_body(new_body)
-
-        if is_semantically_equal(old_body, new_body):
+        equal, changes = prepare_and_compare(
+            pair.old.body, pair.new.body, CRD_NOISE_COMPILED
+        )
+        if equal:
             continue
 
-        dd = DeepDiff(old_body, new_body, verbose_level=2)
-        changes = _extract_changes(dd)
-
         if changes:
             results.append((pair, changes))
 
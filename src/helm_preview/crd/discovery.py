@@ -1,60 +1,91 @@
-"""Discover installed CRDs from the cluster via kubectl."""
+"""Discover installed CRDs from the cluster via the API client or kubectl."""
 
 from __future__ import annotations
 
+import functools
+import json
+
 import yaml
 
+from helm_preview.core import k8s_client
 from helm_preview.core.kubectl import _kube_flags
 from helm_preview.core.runner import RunError, run
+from helm_preview.core.yaml_io import safe_dump, safe_load
+from helm_preview.crd.extraction import CRD_KIND
 from helm_preview.parser.manifest import Resource, parse_multi_doc
 
+# kubectl prints `kind: List`; the API server's own list kind is accepted too
+_LIST_KINDS = ("List", "CustomResourceDefinitionList")
+
+
+def invalidate_cache() -> None:
+    """Drop cached kubectl lookups so the next call re-reads the cluster."""
+    _discover_cluster_crds.cache_clear()
+    _fetch_custom_resources.cache_clear()
+    k8s_client.invalidate_cache()
+
 
 def discover_cluster_crds(**kube_opts: str | None) -> list[Resource]:
-    """Fetch all CRDs from the cluster using kubectl.
+    """Fetch all CRDs from the cluster.
 
-    Returns parsed CRD Resources. On permission errors or connection
-    failures, logs a warning and returns an empty list.
+    Uses the Kubernetes API client when installed, else kubectl. Returns
+    parsed CRD Resources. On permission errors or connection failures,
+    logs a warning and returns an empty list. Results are cached per kube
+    context until invalidate_cache() is called.
     """
+    return list(_discover_cluster_crds(**kube_opts))
+
+
+@functools.lru_cache(maxsize=64)
+def _discover_cluster_crds(**kube_opts: str | None) -> tuple[Resource, ...]:
+    if k8s_client.enabled():
+        try:
+            items = k8s_client.list_crds(**kube_opts)
+        except k8s_client.ClientError:
+            items = None  # e.g. unsupported auth setup: let kubectl try
+        if items is not None:
+            # JSON is valid YAML, and much cheaper to produce
+            return tuple(_crd_resource(item, json.dumps(item)) for item in items)
+
     cmd = ["kubectl", "get", "crds", "-o", "yaml"]
     cmd += _kube_flags(**kube_opts)
 
     try:
         output = run(cmd)
     except RunError:
-        return []
+        return ()
 
     # kubectl get -o yaml returns a List wrapper
     try:
-        data = yaml.safe_load(output)
+        data = safe_load(output)
     except yaml.YAMLError:
-        return []
+        return ()
 
     if not isinstance(data, dict):
-        return []
+        return ()
 
     # Handle List kind wrapper
-    if data.get("kind") == "CustomResourceDefinitionList":
-        items = data.get("items", [])
-        resources: list[Resource] = []
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            metadata = item.get("metadata", {})
-            resources.append(Resource(
-                api_version=item.get("apiVersion", "apiextensions.k8s.io/v1"),
-                kind="CustomResourceDefinition",
-                namespace=metadata.get("namespace", ""),
-                name=metadata.get("name", ""),
-                body=item,
-                raw=yaml.dump(item),
-            ))
-        return resources
+    if data.get("kind") in _LIST_KINDS:
+        return tuple(
+            _crd_resource(item, safe_dump(item))
+            for item in data.get("items") or []
+            if isinstance(item, dict)
+        )
 
     # Fallback: try parsing as multi-doc YAML
-    return [
-        r for r in parse_multi_doc(output)
-        if r.kind == "CustomResourceDefinition"
-    ]
+    return tuple(r for r in parse_multi_doc(output) if r.kind == CRD_KIND)
+
+
+def _crd_resource(item: dict, raw: str) -> Resource:
+    metadata = item.get("metadata", {})
+    return Resource(
+        api_version=item.get("apiVersion", "apiextensions.k8s.io/v1"),
+        kind=CRD_KIND,
+        namespace=metadata.get("namespace", ""),
+        name=metadata.get("name", ""),
+        body=item,
+        raw=raw,
+    )
 
 
 def fetch_custom_resources(
@@ -62,9 +93,24 @@ def fetch_custom_resources(
 ) -> list[dict]:
     """Fetch all instances of a CR from the cluster.
 
-    Uses: kubectl get <plural>.<group> -A -o yaml
-    Returns list of CR body dicts. On error returns empty list.
+    Uses the Kubernetes API client when installed, else
+    kubectl get <plural>.<group> -A -o yaml.
+    Returns list of CR body dicts. On error returns empty list. Results are
+    cached per (plural, group, kube context) until invalidate_cache().
     """
+    return list(_fetch_custom_resources(plural, group, **kube_opts))
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_custom_resources(
+    plural: str, group: str, **kube_opts: str | None
+) -> tuple[dict, ...]:
+    if k8s_client.enabled():
+        try:
+            return tuple(k8s_client.list_custom_objects(plural, group, **kube_opts))
+        except k8s_client.ClientError:
+            pass  # let kubectl try
+
     resource_name = f"{plural}.{group}"
     cmd = ["kubectl", "get", resource_name, "-A", "-o", "yaml"]
     cmd += _kube_flags(**kube_opts)
@@ -72,14 +118,14 @@ def fetch_custom_resources(
     try:
         output = run(cmd)
     except RunError:
-        return []
+        return ()
 
     try:
-        data = yaml.safe_load(output)
+        data = safe_load(output)
     except yaml.YAMLError:
-        return []
+        return ()
 
     if not isinstance(data, dict):
-        return []
+        return ()
 
-    return data.get("items", [])
+    return tuple(data.get("items") or ())
@@ -2,48 +2,70 @@
 
 from __future__ import annotations
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
 from helm_preview.parser.manifest import Resource, parse_multi_doc
 
+CRD_KIND = "CustomResourceDefinition"
+
+# CRD file suffixes, in the order their files are returned
+_CRD_SUFFIXES = (".yaml", ".yml")
+_READ_WORKERS = 8
+
 
 def extract_crds_from_resources(resources: list[Resource]) -> list[Resource]:
     """Filter resources to only CRDs."""
-    return [r for r in resources if r.kind == "CustomResourceDefinition"]
+    return [r for r in resources if r.kind == CRD_KIND]
 
 
 def extract_crds_from_chart_dir(chart_path: str) -> list[Resource]:
     """Read CRD YAML files from a chart's crds/ directory.
 
     Helm charts may place CRDs in a top-level crds/ directory.
-    Returns parsed Resource objects for each CRD found.
+    Returns parsed Resource objects for each CRD found, .yaml files first
+    then .yml files, each in name order. Files are read in parallel and
+    parsed results are cached until the file changes.
     """
     crds_dir = Path(chart_path) / "crds"
     if not crds_dir.is_dir():
         return []
 
-    resources: list[Resource] = []
-    for yaml_file in sorted(crds_dir.glob("*.yaml")):
-        try:
-            text = yaml_file.read_text(encoding="utf-8")
-            parsed = parse_multi_doc(text)
-            for r in parsed:
-                if r.kind == "CustomResourceDefinition":
-                    resources.append(r)
-        except (OSError, yaml.YAMLError):
-            continue
-
-    # Also check .yml files
-    for yaml_file in sorted(crds_dir.glob("*.yml")):
-        try:
-            text = yaml_file.read_text(encoding="utf-8")
-            parsed = parse_multi_doc(text)
-            for r in parsed:
-                if r.kind == "CustomResourceDefinition":
-                    resources.append(r)
-        except (OSError, yaml.YAMLError):
-            continue
-
-    return resources
+    files = _list_crd_files(crds_dir)
+    if not files:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(files))) as pool:
+        parsed = list(pool.map(lambda f: _read_crd_file(*f), files))
+    return [r for file_crds in parsed for r in file_crds]
+
+
+def _list_crd_files(crds_dir: Path) -> list[tuple[str, int, int]]:
+    """Scan crds_dir once; return (path, mtime_ns, size) per CRD file."""
+    by_suffix: dict[str, list[tuple[str, int, int]]] = {s: [] for s in _CRD_SUFFIXES}
+    with os.scandir(crds_dir) as entries:
+        for entry in entries:
+            for suffix in _CRD_SUFFIXES:
+                if entry.name.endswith(suffix):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        break
+                    by_suffix[suffix].append((entry.path, st.st_mtime_ns, st.st_size))
+                    break
+    return [f for suffix in _CRD_SUFFIXES for f in sorted(by_suffix[suffix])]
+
+
+@functools.lru_cache(maxsize=256)
+def _read_crd_file(path: str, mtime_ns: int, size: int) -> tuple[Resource, ...]:
+    """Parse the CRDs in one file. mtime_ns and size key the cache."""
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+        parsed = parse_multi_doc(text)
+    except (OSError, yaml.YAMLError):
+        return ()
+    return tuple(r for r in parsed if r.kind == CRD_KIND)
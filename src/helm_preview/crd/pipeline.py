@@ -55,8 +55,12 @@ def run_crd_pipeline(
         report.policy_result = evaluate_policy(report, policy_mode)
         return report
 
-    # Step 2: Discover installed CRDs
+    # Step 2: Discover installed CRDs, keeping only those relevant
+    # (same names as proposed)
     installed_crds = discover_cluster_crds(**kube_opts)
+    proposed_names = {r.name for r in proposed_crds}
+    installed_relevant = [c for c in installed_crds if c.name in proposed_names]
+
     if not installed_crds:
         report.warnings.append(
             "Could not retrieve installed CRDs from cluster "
@@ -64,10 +68,6 @@ def run_crd_pipeline(
             "Comparing against empty set."
         )
 
-    # Filter installed CRDs to only those relevant (same names as proposed)
-    proposed_names = {r.name for r in proposed_crds}
-    installed_relevant = [r for r in installed_crds if r.name in proposed_names]
-
     # Also include installed CRDs that are being removed (not in proposed)
     # Actually, we only analyze CRDs the chart manages, so just use proposed names
     # plus any installed that might be dropped.
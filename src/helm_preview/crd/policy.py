@@ -29,8 +29,14 @@ def evaluate_policy(report: CrdReport, mode: CrdPolicyMode) -> PolicyResult:
             exit_code=0,
         )
 
-    danger_crds = [c for c in report.crds if c.max_risk == RiskLevel.DANGER]
-    warning_crds = [c for c in report.crds if c.max_risk == RiskLevel.WARNING]
+    danger_crds: list[CrdChangeDetail] = []
+    warning_crds: list[CrdChangeDetail] = []
+    for c in report.crds:
+        risk = c.max_risk
+        if risk is RiskLevel.DANGER:
+            danger_crds.append(c)
+        elif risk is RiskLevel.WARNING:
+            warning_crds.append(c)
 
     if mode == CrdPolicyMode.WARN:
         parts: list[str] = []
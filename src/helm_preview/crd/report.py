@@ -9,7 +9,7 @@ from helm_preview.analysis.risk import RiskAnnotation, RiskLevel
 from helm_preview.diff.engine import FieldChange
 
 
-@dataclass
+@dataclass(slots=True)
 class CrdChangeDetail:
     """A single CRD that was compared (paired old vs new)."""
 
@@ -23,13 +23,13 @@ class CrdChangeDetail:
 
     @property
     def max_risk(self) -> RiskLevel:
+        """Highest annotation level (SAFE if there are none)."""
         if not self.risk_annotations:
             return RiskLevel.SAFE
-        order = {RiskLevel.SAFE: 0, RiskLevel.WARNING: 1, RiskLevel.DANGER: 2}
-        return max(self.risk_annotations, key=lambda a: order[a.level]).level
+        return max(self.risk_annotations, key=lambda a: a.level.rank).level
 
 
-@dataclass
+@dataclass(slots=True)
 class NewCrdInfo:
     """A CRD present in the proposed set but not installed."""
 
@@ -39,7 +39,7 @@ class NewCrdInfo:
     versions: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyResult:
     """Result of policy evaluation."""
 
@@ -49,7 +49,7 @@ class PolicyResult:
     exit_code: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CrdReport:
     """Top-level container for all CRD analysis results."""
 
@@ -61,64 +61,21 @@ class CrdReport:
     @property
     def has_issues(self) -> bool:
         """True if any CRD has WARNING or DANGER annotations."""
-        for crd in self.crds:
-            if crd.max_risk in (RiskLevel.WARNING, RiskLevel.DANGER):
-                return True
-        return False
+        return any(crd.max_risk is not RiskLevel.SAFE for crd in self.crds)
 
     @property
     def has_dangers(self) -> bool:
         """True if any CRD has DANGER annotations."""
-        return any(crd.max_risk == RiskLevel.DANGER for crd in self.crds)
+        return any(crd.max_risk is RiskLevel.DANGER for crd in self.crds)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON output."""
         result: dict[str, Any] = {
-            "crds": [],
-            "new_crds": [],
+            "crds": [_crd_to_dict(crd) for crd in self.crds],
+            "new_crds": [_new_crd_to_dict(new_crd) for new_crd in self.new_crds],
             "warnings": self.warnings,
         }
 
-        for crd in self.crds:
-            crd_dict: dict[str, Any] = {
-                "name": crd.name,
-                "status": crd.status,
-                "max_risk": crd.max_risk.value,
-                "risk_annotations": [
-                    {
-                        "level": a.level.value,
-                        "rule": a.rule,
-                        "message": a.message,
-                        "path": a.path,
-                    }
-                    for a in crd.risk_annotations
-                ],
-                "changes": [
-                    {
-                        "path": fc.path,
-                        "old": fc.old_value,
-                        "new": fc.new_value,
-                        "type": fc.change_type,
-                    }
-                    for fc in crd.changes
-                ],
-            }
-            if crd.stored_version_warnings:
-                crd_dict["stored_version_warnings"] = crd.stored_version_warnings
-            if crd.schema_validation_errors:
-                crd_dict["schema_validation_errors"] = crd.schema_validation_errors
-            if crd.ownership_conflict:
-                crd_dict["ownership_conflict"] = crd.ownership_conflict
-            result["crds"].append(crd_dict)
-
-        for new_crd in self.new_crds:
-            result["new_crds"].append({
-                "name": new_crd.name,
-                "group": new_crd.group,
-                "kind": new_crd.kind,
-                "versions": new_crd.versions,
-            })
-
         if self.policy_result:
             result["policy"] = {
                 "mode": self.policy_result.mode,
@@ -127,3 +84,45 @@ class CrdReport:
             }
 
         return result
+
+
+def _crd_to_dict(crd: CrdChangeDetail) -> dict[str, Any]:
+    crd_dict: dict[str, Any] = {
+        "name": crd.name,
+        "status": crd.status,
+        "max_risk": crd.max_risk.value,
+        "risk_annotations": [
+            {
+                "level": a.level.value,
+                "rule": a.rule,
+                "message": a.message,
+                "path": a.path,
+            }
+            for a in crd.risk_annotations
+        ],
+        "changes": [
+            {
+                "path": fc.path,
+                "old": fc.old_value,
+                "new": fc.new_value,
+                "type": fc.change_type,
+            }
+            for fc in crd.changes
+        ],
+    }
+    if crd.stored_version_warnings:
+        crd_dict["stored_version_warnings"] = crd.stored_version_warnings
+    if crd.schema_validation_errors:
+        crd_dict["schema_validation_errors"] = crd.schema_validation_errors
+    if crd.ownership_conflict:
+        crd_dict["ownership_conflict"] = crd.ownership_conflict
+    return crd_dict
+
+
+def _new_crd_to_dict(new_crd: NewCrdInfo) -> dict[str, Any]:
+    return {
+        "name": new_crd.name,
+        "group": new_crd.group,
+        "kind": new_crd.kind,
+        "versions": new_crd.versions,
+    }
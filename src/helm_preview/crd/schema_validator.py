@@ -2,7 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+import re
+from typing import Any, Callable
+
+from helm_preview.config import EMPTY_MAPPING, EMPTY_SEQUENCE
+
+# OpenAPI type -> accepted Python types
+_TYPE_MAP: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
+# Validator signature: (value, path, errors) -> None, appending to errors
+Validator = Callable[[Any, str, list[str]], None]
+
+# Top-level fields allowed even when additionalProperties is false
+_ALWAYS_ALLOWED = frozenset(("apiVersion", "kind", "metadata", "status"))
+
+# Keywords that produce a check. properties/items/etc. only apply under
+# "type", so a node with none of these (often just {}) never rejects anything
+_ACTIVE_KEYS = frozenset(("type", "enum", "pattern", "minimum", "maximum"))
 
 
 def validate_crs_against_schema(
@@ -10,117 +35,210 @@ def validate_crs_against_schema(
 ) -> list[str]:
     """Validate a list of CR bodies against an OpenAPIV3Schema.
 
-    Uses a recursive walker (no external jsonschema dependency).
+    Compiles the schema once (no external jsonschema dependency), then runs
+    the compiled validator per CR.
     Returns list of human-readable validation error strings.
     """
+    validate = compile_schema(schema)
     errors: list[str] = []
     for cr in crs:
-        name = cr.get("metadata", {}).get("name", "<unknown>")
-        namespace = cr.get("metadata", {}).get("namespace", "")
+        metadata = cr.get("metadata") or EMPTY_MAPPING
+        name = metadata.get("name", "<unknown>")
+        namespace = metadata.get("namespace", "")
         prefix = f"{namespace}/{name}" if namespace else name
-        cr_errors = _validate_object(cr, schema, "")
+        cr_errors: list[str] = []
+        validate(cr, "", cr_errors)
         for err in cr_errors:
             errors.append(f"{prefix}: {err}")
     return errors
 
 
-def _validate_object(value: Any, schema: dict, path: str) -> list[str]:
-    """Recursively validate a value against an OpenAPI v3 schema node."""
-    errors: list[str] = []
+def compile_schema(schema: Any) -> Validator:
+    """Compile an OpenAPI v3 schema node into a validator function.
+
+    Each node becomes a closure that runs only the checks its schema
+    declares, with child nodes compiled ahead of time.
+    """
+    return _compile(schema, {})
+
+
+def _noop(value: Any, path: str, errors: list[str]) -> None:
+    return None
+
 
-    if not isinstance(schema, dict):
-        return errors
+def _compile(schema: Any, memo: dict[int, Validator]) -> Validator:
+    if not isinstance(schema, dict) or _ACTIVE_KEYS.isdisjoint(schema):
+        return _noop
 
+    # Memoize by identity: YAML aliases can share (or nest) schema nodes
+    key = id(schema)
+    if key in memo:
+        return memo[key]
+    compiled: list[Validator] = []
+    memo[key] = lambda value, path, errors: compiled[0](value, path, errors)
+    validator = _compile_node(schema, memo)
+    compiled.append(validator)
+    memo[key] = validator
+    return validator
+
+
+def _compile_node(schema: dict, memo: dict[int, Validator]) -> Validator:
     schema_type = schema.get("type")
+    steps: list[Validator] = []
+
+    if "enum" in schema:
+        steps.append(_enum_check(schema["enum"]))
+    if "pattern" in schema:
+        pattern = _pat(schema["pattern"])
+        if pattern is not None:
+            steps.append(_pattern_check(pattern))
+    if "minimum" in schema:
+        steps.append(_minimum_check(schema["minimum"]))
+    if "maximum" in schema:
+        steps.append(_maximum_check(schema["maximum"]))
+    if schema_type == "object":
+        steps.append(_object_check(schema, memo))
+    elif schema_type == "array":
+        validate_item = _compile(schema.get("items"), memo)
+        if validate_item is not _noop:
+            steps.append(_array_check(validate_item))
+
+    type_check = _type_check(schema_type) if schema_type else None
+    run_steps = tuple(steps)
+
+    if type_check is None:
+        if not run_steps:
+            return _noop
+        if len(run_steps) == 1:
+            return run_steps[0]
+
+        def validate(value: Any, path: str, errors: list[str]) -> None:
+            for step in run_steps:
+                step(value, path, errors)
+        return validate
+
+    def validate_typed(value: Any, path: str, errors: list[str]) -> None:
+        if not type_check(value):
+            errors.append(f"At '{path}': expected type '{schema_type}', got '{type(value).__name__}'")
+            return  # Don't recurse if type is wrong
+        for step in run_steps:
+            step(value, path, errors)
+    return validate_typed
+
+
+def _type_check(schema_type: str) -> Callable[[Any], bool] | None:
+    """Build the OpenAPI type test, or None for unknown types (never rejected)."""
+    expected = _TYPE_MAP.get(schema_type)
+    if expected is None:
+        return None
+    if schema_type == "integer":
+        # bool is subclass of int in Python
+        return lambda value: value is None or (
+            isinstance(value, int) and not isinstance(value, bool)
+        )
+    # null is generally acceptable (x-nullable)
+    return lambda value: value is None or isinstance(value, expected)
 
-    # Type checking
-    if schema_type and not _check_type(value, schema_type):
-        errors.append(f"At '{path}': expected type '{schema_type}', got '{type(value).__name__}'")
-        return errors  # Don't recurse if type is wrong
-
-    # Enum validation
-    if "enum" in schema and value not in schema["enum"]:
-        errors.append(f"At '{path}': value {value!r} not in enum {schema['enum']}")
-
-    # Pattern validation
-    if "pattern" in schema and isinstance(value, str):
-        import re
-        try:
-            if not re.match(schema["pattern"], value):
-                errors.append(f"At '{path}': value '{value}' does not match pattern '{schema['pattern']}'")
-        except re.error:
-            pass
-
-    # Minimum/maximum
-    if "minimum" in schema and isinstance(value, (int, float)):
-        if value < schema["minimum"]:
-            errors.append(f"At '{path}': value {value} < minimum {schema['minimum']}")
-    if "maximum" in schema and isinstance(value, (int, float)):
-        if value > schema["maximum"]:
-            errors.append(f"At '{path}': value {value} > maximum {schema['maximum']}")
-
-    # Object properties
-    if schema_type == "object" and isinstance(value, dict):
-        properties = schema.get("properties", {})
+
+@functools.lru_cache(maxsize=512)
+def _pat(pattern: str) -> re.Pattern[str] | None:
+    """Compile a schema pattern once per process; None if it is invalid.
+
+    Invalid patterns are not enforced.
+    """
+    try:
+        return re.compile(pattern)
+    except (re.error, TypeError):
+        return None
+
+
+def _enum_check(enum: Any) -> Validator:
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if value not in enum:
+            errors.append(f"At '{path}': value {value!r} not in enum {enum}")
+    return check
+
+
+def _pattern_check(pattern: re.Pattern[str]) -> Validator:
+    match = pattern.match
+
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if isinstance(value, str) and not match(value):
+            errors.append(f"At '{path}': value '{value}' does not match pattern '{pattern.pattern}'")
+    return check
+
+
+def _minimum_check(minimum: Any) -> Validator:
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if isinstance(value, (int, float)) and value < minimum:
+            errors.append(f"At '{path}': value {value} < minimum {minimum}")
+    return check
+
+
+def _maximum_check(maximum: Any) -> Validator:
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if isinstance(value, (int, float)) and value > maximum:
+            errors.append(f"At '{path}': value {value} > maximum {maximum}")
+    return check
+
+
+def _object_check(schema: dict, memo: dict[int, Validator]) -> Validator:
+    properties = schema.get("properties") or EMPTY_MAPPING
+    required = tuple(schema.get("required") or EMPTY_SEQUENCE)
+    # Permissive properties ({} and the like) are skipped outright
+    compiled_props = tuple(
+        (name, validate)
+        for name, validate in (
+            (name, _compile(prop_schema, memo)) for name, prop_schema in properties.items()
+        )
+        if validate is not _noop
+    )
+    additional = schema.get("additionalProperties")
+    reject_unknown = additional is False
+    validate_additional = _compile(additional, memo) if isinstance(additional, dict) else None
+    if validate_additional is _noop:
+        validate_additional = None
+
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if not isinstance(value, dict):
+            return
 
         # Check required fields
-        required = schema.get("required", [])
         for req in required:
             if req not in value:
                 errors.append(f"At '{path}': missing required field '{req}'")
 
         # Validate known properties
-        for prop_name, prop_schema in properties.items():
+        prefix = f"{path}." if path else ""
+        for prop_name, validate in compiled_props:
             if prop_name in value:
-                child_path = f"{path}.{prop_name}" if path else prop_name
-                errors.extend(_validate_object(value[prop_name], prop_schema, child_path))
+                validate(value[prop_name], f"{prefix}{prop_name}", errors)
 
         # Check for unknown fields (if no additionalProperties)
-        additional = schema.get("additionalProperties")
-        if additional is False:
+        if reject_unknown:
             for key in value:
-                if key not in properties and key not in ("apiVersion", "kind", "metadata", "status"):
+                if key not in properties and key not in _ALWAYS_ALLOWED:
                     errors.append(f"At '{path}': unknown field '{key}'")
-        elif isinstance(additional, dict):
+        elif validate_additional is not None:
             for key in value:
                 if key not in properties:
-                    child_path = f"{path}.{key}" if path else key
-                    errors.extend(_validate_object(value[key], additional, child_path))
+                    validate_additional(value[key], f"{prefix}{key}", errors)
+    return check
 
-    # Array items
-    if schema_type == "array" and isinstance(value, list):
-        items_schema = schema.get("items", {})
-        for i, item in enumerate(value):
-            child_path = f"{path}[{i}]"
-            errors.extend(_validate_object(item, items_schema, child_path))
-
-    return errors
 
-
-def _check_type(value: Any, schema_type: str) -> bool:
-    """Check if a value matches the OpenAPI type."""
-    if value is None:
-        return True  # null is generally acceptable (x-nullable)
-    type_map = {
-        "string": str,
-        "integer": int,
-        "number": (int, float),
-        "boolean": bool,
-        "object": dict,
-        "array": list,
-    }
-    expected = type_map.get(schema_type)
-    if expected is None:
-        return True  # Unknown type, don't reject
-    if schema_type == "integer" and isinstance(value, bool):
-        return False  # bool is subclass of int in Python
-    return isinstance(value, expected)
+def _array_check(validate_item: Validator) -> Validator:
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if not isinstance(value, list):
+            return
+        for i, item in enumerate(value):
+            validate_item(item, f"{path}[{i}]", errors)
+    return check
 
 
 def find_schema_for_version(crd_body: dict, version: str) -> dict | None:
     """Extract the openAPIV3Schema for a specific version from a CRD body."""
-    versions = crd_body.get("spec", {}).get("versions", [])
+    versions = (crd_body.get("spec") or EMPTY_MAPPING).get("versions") or EMPTY_SEQUENCE
     for v in versions:
         if v.get("name") == version:
-            return v.get("schema", {}).get("openAPIV3Schema")
+            return (v.get("schema") or EMPTY_MAPPING).get("openAPIV3Schema")
     return None
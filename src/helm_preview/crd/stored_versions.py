@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+from helm_preview.config import EMPTY_MAPPING, EMPTY_SEQUENCE
 from helm_preview.parser.manifest import Resource
 
+_REMOVED_STORED_VERSION = (
+    "Stored version '{0}' is still in status.storedVersions "
+    "but is being removed from spec.versions. "
+    "Existing objects stored as '{0}' may become inaccessible. "
+    "Migrate objects before removing the version."
+)
+
 
 def check_stored_version_safety(
     old_crd: Resource, new_crd: Resource
@@ -15,25 +23,20 @@ def check_stored_version_safety(
 
     Returns list of warning messages for any unsafe removals.
     """
-    old_status = old_crd.body.get("status", {})
-    stored_versions = old_status.get("storedVersions", [])
+    old_status = old_crd.body.get("status") or EMPTY_MAPPING
+    stored_versions = old_status.get("storedVersions") or EMPTY_SEQUENCE
 
     if not stored_versions:
         return []
 
-    new_spec = new_crd.body.get("spec", {})
+    new_spec = new_crd.body.get("spec") or EMPTY_MAPPING
     new_version_names = {
-        v.get("name", "") for v in new_spec.get("versions", [])
+        v.get("name", "") for v in new_spec.get("versions") or EMPTY_SEQUENCE
     }
 
-    warnings: list[str] = []
-    for sv in stored_versions:
-        if sv not in new_version_names:
-            warnings.append(
-                f"Stored version '{sv}' is still in status.storedVersions "
-                f"but is being removed from spec.versions. "
-                f"Existing objects stored as '{sv}' may become inaccessible. "
-                f"Migrate objects before removing the version."
-            )
-
-    return warnings
+    # Iterate the stored list (not a set difference) to keep its order
+    return [
+        _REMOVED_STORED_VERSION.format(sv)
+        for sv in stored_versions
+        if sv not in new_version_names
+    ]
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import datetime
+import difflib
 from dataclasses import dataclass, field
+from itertools import zip_longest
 from typing import Any, Literal
 
 from deepdiff import DeepDiff
 
-from helm_preview.diff.filters import normalize_body, strip_noise
+from helm_preview.diff.filters import NoiseTrie, normalize_body, prepare_body, strip_noise
 from helm_preview.diff.semantic import is_semantically_equal
 from helm_preview.parser.manifest import ResourcePair
 
@@ -178,6 +181,166 @@ def _deepdiff_path_to_dot(path: str) -> str:
     return result
 
 
+# Leaf types whose lists are diffed by sequence matching rather than by
+# position (mirrors DeepDiff's basic_types for what YAML can produce).
+_BASIC_TYPES = (str, bytes, int, float, bool, type(None), datetime.date, datetime.datetime)
+_MISSING = object()
+
+# Emission order of change buckets, matching _extract_changes.
+_BUCKETS = (
+    "values_changed",
+    "type_changes",
+    "dict_added",
+    "dict_removed",
+    "iter_added",
+    "iter_removed",
+)
+
+
+def prepare_and_compare(
+    old_body: dict, new_body: dict, noise: NoiseTrie | None = None
+) -> tuple[bool, list[FieldChange]]:
+    """Strip noise, normalize and diff two bodies.
+
+    Returns (equal, changes); changes is empty when the bodies are
+    semantically equal.
+    """
+    old = prepare_body(old_body, noise)
+    new = prepare_body(new_body, noise)
+    if is_semantically_equal(old, new):
+        return True, []
+    return False, diff_bodies(old, new)
+
+
+def diff_bodies(old: Any, new: Any) -> list[FieldChange]:
+    """Structurally diff two normalized bodies into FieldChanges.
+
+    Produces the same changes, in the same order, as
+    _extract_changes(DeepDiff(old, new, verbose_level=2)) without building
+    DeepDiff's intermediate tree and re-parsing its paths.
+    """
+    buckets: dict[str, list[FieldChange]] = {name: [] for name in _BUCKETS}
+    _walk(old, new, "", buckets)
+
+    # An index both removed and added is reported as a value change.
+    removed = {fc.path: fc for fc in buckets["iter_removed"]}
+    mutual = [fc for fc in buckets["iter_added"] if fc.path in removed]
+    if mutual:
+        paths = {fc.path for fc in mutual}
+        buckets["iter_added"] = [fc for fc in buckets["iter_added"] if fc.path not in paths]
+        buckets["iter_removed"] = [fc for fc in buckets["iter_removed"] if fc.path not in paths]
+        for fc in mutual:
+            buckets["values_changed"].append(FieldChange(
+                path=fc.path,
+                old_value=removed[fc.path].old_value,
+                new_value=fc.new_value,
+                change_type="value_changed",
+            ))
+
+    changes: list[FieldChange] = []
+    for name in _BUCKETS:
+        changes.extend(buckets[name])
+    return changes
+
+
+def _key_path(path: str, key: Any) -> str:
+    if isinstance(key, str):
+        return f"{path}.{key}" if path else key
+    return f"{path}[{key}]"
+
+
+def _walk(old: Any, new: Any, path: str, buckets: dict[str, list[FieldChange]]) -> None:
+    if old is new:
+        return
+
+    if type(old) is not type(new):
+        buckets["type_changes"].append(FieldChange(path, old, new, "type_changed"))
+        return
+
+    if isinstance(old, dict):
+        common = [k for k in new if k in old]
+        union = len(old) + len(new) - len(common)
+        # DeepDiff reports mostly-disjoint dicts as one replaced value
+        if union > 1 and len(common) / union < 0.33:
+            buckets["values_changed"].append(FieldChange(path, old, new, "value_changed"))
+            return
+        added = buckets["dict_added"]
+        for k, v in new.items():
+            if k not in old:
+                added.append(FieldChange(_key_path(path, k), None, v, "item_added"))
+        removed = buckets["dict_removed"]
+        for k, v in old.items():
+            if k not in new:
+                removed.append(FieldChange(_key_path(path, k), v, None, "item_removed"))
+        old_get = old.get
+        for k in common:
+            _walk(old_get(k), new[k], _key_path(path, k), buckets)
+        return
+
+    if isinstance(old, list):
+        _walk_list(old, new, path, buckets)
+        return
+
+    if old != new:
+        buckets["values_changed"].append(FieldChange(path, old, new, "value_changed"))
+
+
+def _walk_pairwise(
+    old: list[Any],
+    new: list[Any],
+    path: str,
+    buckets: dict[str, list[FieldChange]],
+    old_from: int = 0,
+    new_from: int = 0,
+) -> None:
+    for i, (x, y) in enumerate(zip_longest(old, new, fillvalue=_MISSING)):
+        old_idx = i + old_from
+        new_idx = i + new_from
+        if y is _MISSING:
+            buckets["iter_removed"].append(FieldChange(f"{path}[{old_idx}]", x, None, "item_removed"))
+        elif x is _MISSING:
+            buckets["iter_added"].append(FieldChange(f"{path}[{new_idx}]", None, y, "item_added"))
+        elif old_idx != new_idx and x == y:
+            continue  # moved, not changed
+        else:
+            _walk(x, y, f"{path}[{old_idx}]", buckets)
+
+
+def _walk_list(
+    old: list[Any], new: list[Any], path: str, buckets: dict[str, list[FieldChange]]
+) -> None:
+    if not (
+        all(isinstance(x, _BASIC_TYPES) for x in old)
+        and all(isinstance(x, _BASIC_TYPES) for x in new)
+    ):
+        _walk_pairwise(old, new, path, buckets)
+        return
+
+    # Lists of leaves: align with difflib, but keep the positional diff
+    # when it is at least as short.
+    local: dict[str, list[FieldChange]] = {name: [] for name in _BUCKETS}
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "replace":
+            _walk_pairwise(old[i1:i2], new[j1:j2], path, local, i1, j1)
+        elif tag == "delete":
+            for idx in range(i1, i2):
+                local["iter_removed"].append(FieldChange(f"{path}[{idx}]", old[idx], None, "item_removed"))
+        elif tag == "insert":
+            for idx in range(j1, j2):
+                local["iter_added"].append(FieldChange(f"{path}[{idx}]", None, new[idx], "item_added"))
+
+    count = sum(map(len, local.values()))
+    if count > 1:
+        positional: dict[str, list[FieldChange]] = {name: [] for name in _BUCKETS}
+        _walk_pairwise(old, new, path, positional)
+        if count >= sum(map(len, positional.values())):
+            local = positional
+
+    for name in _BUCKETS:
+        buckets[name].extend(local[name])
+
+
 def diff_all(
     pairs: list[ResourcePair],
     show_all: bool = False,
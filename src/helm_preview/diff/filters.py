@@ -4,21 +4,139 @@ from __future__ import annotations
 
 import copy
 import fnmatch
+import functools
 import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 
 from helm_preview.config import NOISE_PATHS, UNORDERED_LIST_SORT_KEYS
 
 
-def strip_noise(body: dict, extra_ignores: list[str] | None = None) -> dict:
+@dataclass
+class NoiseTrie:
+    """Noise paths parsed into a trie keyed by path segment.
+
+    exact/globs hold the leaf segments removed at this level; children
+    continue paths through nested dicts.
+    """
+    exact: set[str] = field(default_factory=set)
+    globs: list[re.Pattern[str]] = field(default_factory=list)
+    children: dict[str, NoiseTrie] = field(default_factory=dict)
+
+    def drops(self, key: str) -> bool:
+        return key in self.exact or any(g.match(key) for g in self.globs)
+
+
+@dataclass
+class _SortNode:
+    """UNORDERED_LIST_SORT_KEYS parsed into a trie ("*" = each list item)."""
+    sort_key: str | None = None
+    children: dict[str, _SortNode] = field(default_factory=dict)
+
+
+def compile_noise_paths(paths: Iterable[str]) -> NoiseTrie:
+    """Parse dot-paths (same syntax as strip_noise) into a NoiseTrie."""
+    root = NoiseTrie()
+    for path in paths:
+        *parents, leaf = _split_dot_path(path)
+        node = root
+        for part in parents:
+            node = node.children.setdefault(part, NoiseTrie())
+        if '*' in leaf or '?' in leaf or '[' in leaf:
+            node.globs.append(re.compile(fnmatch.translate(leaf)))
+        else:
+            node.exact.add(leaf)
+    return root
+
+
+def _compile_sort_keys(sort_keys: dict[str, str]) -> _SortNode:
+    root = _SortNode()
+    for path, sort_key in sort_keys.items():
+        node = root
+        for part in path.split("."):
+            node = node.children.setdefault(part, _SortNode())
+        node.sort_key = sort_key
+    return root
+
+
+_SORT_TRIE = _compile_sort_keys(UNORDERED_LIST_SORT_KEYS)
+
+
+def prepare_body(body: dict, noise: NoiseTrie | None = None) -> dict:
+    """Strip noise and normalize in a single copying pass.
+
+    Equivalent to normalize_body(strip_noise(body, ...)) for the paths
+    compiled into noise, without the intermediate copies.
+    """
+    return _prepare(body, noise, _SORT_TRIE)
+
+
+def _prepare(obj: object, noise: NoiseTrie | None, sort_node: _SortNode | None) -> object:
+    if isinstance(obj, dict):
+        result = {}
+        for key, value in sorted(obj.items()):
+            child_noise = None
+            if noise is not None:
+                if noise.drops(key):
+                    continue
+                if isinstance(value, dict):
+                    child_noise = noise.children.get(key)
+            child_sort = sort_node.children.get(key) if sort_node is not None else None
+            value = _prepare(value, child_noise, child_sort)
+            if child_sort is not None and child_sort.sort_key is not None and isinstance(value, list):
+                value = _sorted_by_key(value, child_sort.sort_key)
+            result[key] = value
+        return result
+    if isinstance(obj, list):
+        # Noise paths never descend into lists
+        item_sort = sort_node.children.get("*") if sort_node is not None else None
+        return [_prepare(item, None, item_sort) for item in obj]
+    return obj
+
+
+def _sorted_by_key(items: list, sort_key: str) -> list:
+    try:
+        return sorted(
+            items,
+            key=lambda item: item.get(sort_key, "") if isinstance(item, dict) else "",
+        )
+    except (TypeError, AttributeError):
+        return items
+
+
+def strip_noise(
+    body: dict,
+    extra_ignores: list[str] | None = None,
+    noise: NoiseTrie | None = None,
+) -> dict:
     """Deep-copy body and remove all paths matching NOISE_PATHS + extra_ignores.
 
     Supports glob patterns on leaf keys (e.g. annotations.prefix/*).
     Dot-paths use backslash-escaped dots for literal dots in keys.
+    A precompiled noise (see compile_noise_paths) replaces
+    NOISE_PATHS + extra_ignores when given.
     """
-    result = copy.deepcopy(body)
-    all_paths = NOISE_PATHS | set(extra_ignores or [])
-    for path in all_paths:
-        _remove_path(result, path)
+    if noise is None:
+        noise = _default_noise(frozenset(extra_ignores or ()))
+    return _strip_copy(body, noise)
+
+
+@functools.lru_cache(maxsize=32)
+def _default_noise(extra_ignores: frozenset[str]) -> NoiseTrie:
+    return compile_noise_paths(NOISE_PATHS | extra_ignores)
+
+
+def _strip_copy(obj: dict, noise: NoiseTrie) -> dict:
+    """Copy obj, dropping noise keys; subtrees without noise are deep-copied."""
+    result = {}
+    for key, value in obj.items():
+        if noise.drops(key):
+            continue
+        child = noise.children.get(key)
+        if child is not None and isinstance(value, dict):
+            result[key] = _strip_copy(value, child)
+        else:
+            result[key] = copy.deepcopy(value)
     return result
 
 
@@ -34,34 +152,6 @@ def _split_dot_path(path: str) -> list[str]:
     return [p.replace('\\.', '.') for p in parts]
 
 
-def _remove_path(obj: dict, path: str) -> None:
-    """Remove a dot-path from a nested dict. Supports glob on the last segment."""
-    parts = _split_dot_path(path)
-    _remove_path_parts(obj, parts)
-
-
-def _remove_path_parts(obj: object, parts: list[str]) -> None:
-    """Recursively walk into obj following parts, removing the leaf."""
-    if not parts or not isinstance(obj, dict):
-        return
-
-    key = parts[0]
-    remaining = parts[1:]
-
-    if not remaining:
-        # Leaf: remove matching keys (supports glob)
-        if '*' in key or '?' in key or '[' in key:
-            to_remove = [k for k in obj if fnmatch.fnmatch(k, key)]
-            for k in to_remove:
-                del obj[k]
-        elif key in obj:
-            del obj[key]
-    else:
-        # Intermediate: recurse
-        if key in obj and isinstance(obj[key], dict):
-            _remove_path_parts(obj[key], remaining)
-
-
 def normalize_body(body: dict) -> dict:
     """Sort dict keys recursively. Normalize known unordered lists."""
     result = copy.deepcopy(body)
@@ -5,10 +5,23 @@ from __future__ import annotations
 import json
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional dependency (pip install helm-preview[fast])
+    orjson = None
+
 from helm_preview.analysis.ownership import OwnershipInfo
 from helm_preview.analysis.risk import RiskAnnotation, RiskLevel
 from helm_preview.diff.engine import ChangeRecord
 
+# Match the stdlib output: 2-space indent, non-str keys coerced to
+# strings, datetimes stringified through default=str
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
 
 def render_json(
     results: list[tuple[ChangeRecord, list[RiskAnnotation], OwnershipInfo | None]],
@@ -16,31 +29,20 @@ def render_json(
     crd_report: "CrdReport | None" = None,
 ) -> str:
     """Produce structured JSON output."""
-    added = sum(1 for cr, _, _ in results if cr.status == "added")
-    removed = sum(1 for cr, _, _ in results if cr.status == "removed")
-    changed = sum(1 for cr, _, _ in results if cr.status == "changed")
-
+    status_counts = {"added": 0, "removed": 0, "changed": 0}
     risk_counts = {level.value: 0 for level in RiskLevel}
-    for _, annotations, _ in results:
-        for a in annotations:
-            risk_counts[a.level.value] += 1
-    # Changes with no risk annotations count as safe
-    for cr, annotations, _ in results:
-        if not annotations:
-            risk_counts["safe"] += 1
-
-    output: dict[str, Any] = {
-        "summary": {
-            "added": added,
-            "removed": removed,
-            "changed": changed,
-            "unchanged": total_unchanged,
-        },
-        "risk_summary": risk_counts,
-        "changes": [],
-    }
+    changes_out: list[dict[str, Any]] = []
 
+    # One pass: tally summaries while building each change object
     for change, risk_annotations, ownership in results:
+        status_counts[change.status] += 1
+        if risk_annotations:
+            for a in risk_annotations:
+                risk_counts[a.level.value] += 1
+        else:
+            # Changes with no risk annotations count as safe
+            risk_counts["safe"] += 1
+
         change_obj: dict[str, Any] = {
             "resource": change.resource_key,
             "kind": change.kind,
@@ -69,28 +71,38 @@ def render_json(
             change_obj["fields"] = [
                 {
                     "path": fc.path,
-                    "old": _serialize_value(fc.old_value),
-                    "new": _serialize_value(fc.new_value),
+                    "old": fc.old_value,
+                    "new": fc.new_value,
                     "type": fc.change_type,
                 }
                 for fc in change.changes
             ]
 
-        output["changes"].append(change_obj)
+        changes_out.append(change_obj)
+
+    output: dict[str, Any] = {
+        "summary": {
+            **status_counts,
+            "unchanged": total_unchanged,
+        },
+        "risk_summary": risk_counts,
+        "changes": changes_out,
+    }
 
     # Add CRD analysis if present
     if crd_report:
         output["crd_analysis"] = crd_report.to_dict()
 
-    return json.dumps(output, indent=2, default=str)
+    # Field values are encoded as-is; non-JSON leaves (e.g. dates) are
+    # stringified by the encoder
+    return _dumps(output)
 
 
-def _serialize_value(value: Any) -> Any:
-    """Ensure value is JSON-serializable."""
-    if isinstance(value, (str, int, float, bool, type(None))):
-        return value
-    if isinstance(value, (list, tuple)):
-        return [_serialize_value(v) for v in value]
-    if isinstance(value, dict):
-        return {k: _serialize_value(v) for k, v in value.items()}
-    return str(value)
+def _dumps(data: Any) -> str:
+    """Encode with orjson when installed, else (or on failure) the stdlib."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            pass
+    return json.dumps(data, indent=2, default=str)
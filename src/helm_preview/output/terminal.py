@@ -31,6 +31,12 @@ STATUS_STYLES = {
     "changed": ("CHANGED", "yellow bold"),
 }
 
+# Suffix on field paths with risk annotations
+_RISK_MARKERS = {
+    RiskLevel.WARNING: " !",
+    RiskLevel.DANGER: " !!",
+}
+
 
 def render_terminal(
     results: list[tuple[ChangeRecord, list[RiskAnnotation], OwnershipInfo | None]],
@@ -40,7 +46,10 @@ def render_terminal(
     risk_only: bool = False,
     crd_report: "CrdReport | None" = None,
 ) -> None:
-    """Print colored diff to terminal."""
+    """Print colored diff to terminal.
+
+    Falls back to plain text with no_color or when stdout is not a terminal.
+    """
     console = Console(no_color=no_color)
 
     if risk_only:
@@ -49,6 +58,11 @@ def render_terminal(
             if any(a.level in (RiskLevel.WARNING, RiskLevel.DANGER) for a in ra)
         ]
 
+    # Plain text when color is off or output is piped: no Rich layout work
+    if no_color or not console.is_terminal:
+        _render_plain(console, results, crd_report=crd_report)
+        return
+
     if not results and not crd_report:
         console.print("[dim]No changes detected.[/dim]")
         return
@@ -97,9 +111,11 @@ def _render_resource(
         console.print(Panel(title, border_style=status_style.split()[0]))
     else:
         # Show field changes
-        content = Text()
+        risk_by_path = _risk_by_path(risk_annotations)
+        spans: list[tuple[str, str]] = []
         for fc in change.changes:
-            _render_field_change(content, fc, risk_annotations)
+            spans.extend(_render_field_change(fc, risk_by_path))
+        content = Text.assemble(*spans)
 
         panel = Panel(
             content,
@@ -120,35 +136,46 @@ def _render_resource(
 
 
 def _render_field_change(
-    content: Text,
     fc: FieldChange,
-    risk_annotations: list[RiskAnnotation],
-) -> None:
-    """Render a single field change."""
-    # Check if this field has risk annotations
-    field_risks = [a for a in risk_annotations if a.path == fc.path]
-    risk_marker = ""
-    if field_risks:
-        max_level = max(a.level.value for a in field_risks)
-        if max_level == RiskLevel.DANGER.value:
-            risk_marker = " !!"
-        elif max_level == RiskLevel.WARNING.value:
-            risk_marker = " !"
+    risk_by_path: dict[str, RiskLevel],
+) -> list[tuple[str, str]]:
+    """Render a single field change as (text, style) spans."""
+    # Mark fields that carry risk annotations
+    risk_marker = _RISK_MARKERS.get(risk_by_path.get(fc.path), "")
 
     if fc.change_type == "value_changed":
-        content.append(f"  ~ {fc.path}{risk_marker}\n", style="yellow")
-        content.append(f"    - {_format_value(fc.old_value)}\n", style="red")
-        content.append(f"    + {_format_value(fc.new_value)}\n", style="green")
-    elif fc.change_type == "type_changed":
-        content.append(f"  ~ {fc.path} (type changed){risk_marker}\n", style="yellow")
-        content.append(f"    - {_format_value(fc.old_value)} ({type(fc.old_value).__name__})\n", style="red")
-        content.append(f"    + {_format_value(fc.new_value)} ({type(fc.new_value).__name__})\n", style="green")
-    elif fc.change_type == "item_added":
-        content.append(f"  + {fc.path}{risk_marker}\n", style="green")
-        content.append(f"    {_format_value(fc.new_value)}\n", style="green")
-    elif fc.change_type == "item_removed":
-        content.append(f"  - {fc.path}{risk_marker}\n", style="red")
-        content.append(f"    {_format_value(fc.old_value)}\n", style="red")
+        return [
+            (f"  ~ {fc.path}{risk_marker}\n", "yellow"),
+            (f"    - {_format_value(fc.old_value)}\n", "red"),
+            (f"    + {_format_value(fc.new_value)}\n", "green"),
+        ]
+    if fc.change_type == "type_changed":
+        return [
+            (f"  ~ {fc.path} (type changed){risk_marker}\n", "yellow"),
+            (f"    - {_format_value(fc.old_value)} ({type(fc.old_value).__name__})\n", "red"),
+            (f"    + {_format_value(fc.new_value)} ({type(fc.new_value).__name__})\n", "green"),
+        ]
+    if fc.change_type == "item_added":
+        return [
+            (f"  + {fc.path}{risk_marker}\n", "green"),
+            (f"    {_format_value(fc.new_value)}\n", "green"),
+        ]
+    if fc.change_type == "item_removed":
+        return [
+            (f"  - {fc.path}{risk_marker}\n", "red"),
+            (f"    {_format_value(fc.old_value)}\n", "red"),
+        ]
+    return []
+
+
+def _risk_by_path(annotations: list[RiskAnnotation]) -> dict[str, RiskLevel]:
+    """Highest risk level per annotated path."""
+    risk_by_path: dict[str, RiskLevel] = {}
+    for a in annotations:
+        current = risk_by_path.get(a.path)
+        if current is None or a.level.rank > current.rank:
+            risk_by_path[a.path] = a.level
+    return risk_by_path
 
 
 def _format_value(value: object) -> str:
@@ -163,8 +190,7 @@ def _max_risk(annotations: list[RiskAnnotation]) -> RiskLevel | None:
     """Get the highest risk level from a list of annotations."""
     if not annotations:
         return None
-    order = {RiskLevel.SAFE: 0, RiskLevel.WARNING: 1, RiskLevel.DANGER: 2}
-    return max(annotations, key=lambda a: order[a.level]).level
+    return max(annotations, key=lambda a: a.level.rank).level
 
 
 def _render_crd_section(console: Console, crd_report: "CrdReport") -> None:
@@ -187,9 +213,8 @@ def _render_crd_section(console: Console, crd_report: "CrdReport") -> None:
             status_label, status_style = STATUS_STYLES.get(
                 crd.status, ("UNKNOWN", "dim")
             )
-            risk_label, risk_style = RISK_STYLES.get(
-                crd.max_risk, ("SAFE", "green")
-            )
+            # max_risk is always a RiskLevel, and RISK_STYLES covers them all
+            risk_label, risk_style = RISK_STYLES[crd.max_risk]
             details = f"{len(crd.changes)} change(s)" if crd.changes else ""
             table.add_row(
                 crd.name,
@@ -213,35 +238,27 @@ def _render_crd_section(console: Console, crd_report: "CrdReport") -> None:
         console.print()
 
     # Ownership conflicts
-    conflicts = [c for c in crd_report.crds if c.ownership_conflict]
-    if conflicts:
+    if any(c.ownership_conflict for c in crd_report.crds):
         console.print("[bold yellow]Ownership Conflicts:[/bold yellow]")
-        for crd in conflicts:
-            console.print(f"  [yellow]![/yellow] {crd.ownership_conflict}")
+        for crd in crd_report.crds:
+            if crd.ownership_conflict:
+                console.print(f"  [yellow]![/yellow] {crd.ownership_conflict}")
         console.print()
 
     # Stored-version warnings
-    sv_warnings = [
-        (c.name, w)
-        for c in crd_report.crds
-        for w in c.stored_version_warnings
-    ]
-    if sv_warnings:
+    if any(c.stored_version_warnings for c in crd_report.crds):
         console.print("[bold yellow]Stored Version Warnings:[/bold yellow]")
-        for name, warning in sv_warnings:
-            console.print(f"  [yellow]![/yellow] {name}: {warning}")
+        for crd in crd_report.crds:
+            for warning in crd.stored_version_warnings:
+                console.print(f"  [yellow]![/yellow] {crd.name}: {warning}")
         console.print()
 
     # Schema validation issues
-    schema_errors = [
-        (c.name, e)
-        for c in crd_report.crds
-        for e in c.schema_validation_errors
-    ]
-    if schema_errors:
+    if any(c.schema_validation_errors for c in crd_report.crds):
         console.print("[bold red]Schema Validation Issues:[/bold red]")
-        for name, error in schema_errors:
-            console.print(f"  [red]!![/red] {name}: {error}")
+        for crd in crd_report.crds:
+            for error in crd.schema_validation_errors:
+                console.print(f"  [red]!![/red] {crd.name}: {error}")
         console.print()
 
     # Risk details for each CRD
@@ -275,31 +292,168 @@ def _render_summary(
     crd_report: "CrdReport | None" = None,
 ) -> None:
     """Render summary table at the bottom."""
-    added = sum(1 for cr, _, _ in results if cr.status == "added")
-    removed = sum(1 for cr, _, _ in results if cr.status == "removed")
-    changed = sum(1 for cr, _, _ in results if cr.status == "changed")
-    warnings = sum(
-        sum(1 for a in ra if a.level == RiskLevel.WARNING) for _, ra, _ in results
-    )
-    dangers = sum(
-        sum(1 for a in ra if a.level == RiskLevel.DANGER) for _, ra, _ in results
-    )
-
     table = Table(title="Summary", show_header=False, box=None)
-    table.add_row("[green]Added[/green]", str(added))
-    table.add_row("[red]Removed[/red]", str(removed))
-    table.add_row("[yellow]Changed[/yellow]", str(changed))
+    for label, style, count in _summary_rows(results, crd_report):
+        table.add_row(f"[{style}]{label}[/{style}]", str(count))
+    console.print(table)
+
+
+def _summary_rows(
+    results: list[tuple[ChangeRecord, list[RiskAnnotation], OwnershipInfo | None]],
+    crd_report: "CrdReport | None" = None,
+) -> list[tuple[str, str, int]]:
+    """Summary (label, style, count) rows, in display order."""
+    added = removed = changed = warnings = dangers = 0
+    for cr, ra, _ in results:
+        status = cr.status
+        if status == "added":
+            added += 1
+        elif status == "removed":
+            removed += 1
+        elif status == "changed":
+            changed += 1
+        for a in ra:
+            level = a.level
+            if level is RiskLevel.WARNING:
+                warnings += 1
+            elif level is RiskLevel.DANGER:
+                dangers += 1
+
+    rows = [
+        ("Added", "green", added),
+        ("Removed", "red", removed),
+        ("Changed", "yellow", changed),
+    ]
     if warnings:
-        table.add_row("[yellow]Warnings[/yellow]", str(warnings))
+        rows.append(("Warnings", "yellow", warnings))
     if dangers:
-        table.add_row("[red bold]Dangers[/red bold]", str(dangers))
+        rows.append(("Dangers", "red bold", dangers))
 
     if crd_report:
         crd_changed = sum(1 for c in crd_report.crds if c.status == "changed")
         crd_new = len(crd_report.new_crds)
         if crd_changed or crd_new:
-            table.add_row("[cyan]CRDs Changed[/cyan]", str(crd_changed))
+            rows.append(("CRDs Changed", "cyan", crd_changed))
             if crd_new:
-                table.add_row("[cyan]CRDs New[/cyan]", str(crd_new))
+                rows.append(("CRDs New", "cyan", crd_new))
+    return rows
 
-    console.print(table)
+
+def _render_plain(
+    console: Console,
+    results: list[tuple[ChangeRecord, list[RiskAnnotation], OwnershipInfo | None]],
+    crd_report: "CrdReport | None" = None,
+) -> None:
+    """Write the diff as plain, unwrapped text in a single write.
+
+    Used for --no-color and non-terminal output (pipes, CI logs), where
+    Rich's panels and styling would only be stripped again.
+    """
+    lines: list[str] = []
+    if not results and not crd_report:
+        lines.append("No changes detected.")
+    else:
+        for change, risk_annotations, ownership in results:
+            _plain_resource(lines, change, risk_annotations, ownership)
+        if crd_report:
+            _plain_crd_section(lines, crd_report)
+        lines.append("Summary:")
+        rows = _summary_rows(results, crd_report)
+        width = max(len(label) for label, _, _ in rows)
+        for label, _, count in rows:
+            lines.append(f"  {label.ljust(width)}  {count}")
+    lines.append("")
+    console.file.write("\n".join(lines))
+
+
+def _plain_resource(
+    lines: list[str],
+    change: ChangeRecord,
+    risk_annotations: list[RiskAnnotation],
+    ownership: OwnershipInfo | None,
+) -> None:
+    """Plain-text counterpart of _render_resource."""
+    status_label, _ = STATUS_STYLES[change.status]
+    title = f"[{status_label}] {change.kind}/{change.name}  ({change.namespace})"
+    if ownership:
+        owner_label, _ = OWNER_STYLES.get(ownership.manager, ("unknown", "dim"))
+        title += f" [{owner_label}]"
+    max_risk = _max_risk(risk_annotations)
+    if max_risk:
+        title += f" [{RISK_STYLES[max_risk][0]}]"
+    lines.append(title)
+
+    if change.status == "changed":
+        risk_by_path = _risk_by_path(risk_annotations)
+        for fc in change.changes:
+            for text, _ in _render_field_change(fc, risk_by_path):
+                lines.append(text[:-1])  # spans end in a newline
+
+    for annotation in risk_annotations:
+        lines.append(f"  {RISK_STYLES[annotation.level][0]}: {annotation.message}")
+    lines.append("")
+
+
+def _plain_crd_section(lines: list[str], crd_report: "CrdReport") -> None:
+    """Plain-text counterpart of _render_crd_section."""
+    lines.append("== CRD Analysis ==")
+    lines.append("")
+
+    if crd_report.crds:
+        rows = [("CRD Name", "Status", "Risk", "Details")]
+        for crd in crd_report.crds:
+            status_label, _ = STATUS_STYLES.get(crd.status, ("UNKNOWN", "dim"))
+            risk_label, _ = RISK_STYLES[crd.max_risk]
+            details = f"{len(crd.changes)} change(s)" if crd.changes else ""
+            rows.append((crd.name, status_label, risk_label, details))
+        widths = [max(len(row[i]) for row in rows) for i in range(3)]
+        lines.append("CRD Changes:")
+        for name, status, risk, details in rows:
+            lines.append(
+                f"  {name.ljust(widths[0])}  {status.ljust(widths[1])}  "
+                f"{risk.ljust(widths[2])}  {details}".rstrip()
+            )
+        lines.append("")
+
+    if crd_report.new_crds:
+        lines.append("New CRDs:")
+        for new_crd in crd_report.new_crds:
+            versions_str = ", ".join(new_crd.versions)
+            lines.append(f"  + {new_crd.name} ({new_crd.kind}) versions: {versions_str}")
+        lines.append("")
+
+    if any(c.ownership_conflict for c in crd_report.crds):
+        lines.append("Ownership Conflicts:")
+        for crd in crd_report.crds:
+            if crd.ownership_conflict:
+                lines.append(f"  ! {crd.ownership_conflict}")
+        lines.append("")
+
+    if any(c.stored_version_warnings for c in crd_report.crds):
+        lines.append("Stored Version Warnings:")
+        for crd in crd_report.crds:
+            for warning in crd.stored_version_warnings:
+                lines.append(f"  ! {crd.name}: {warning}")
+        lines.append("")
+
+    if any(c.schema_validation_errors for c in crd_report.crds):
+        lines.append("Schema Validation Issues:")
+        for crd in crd_report.crds:
+            for error in crd.schema_validation_errors:
+                lines.append(f"  !! {crd.name}: {error}")
+        lines.append("")
+
+    for crd in crd_report.crds:
+        for annotation in crd.risk_annotations:
+            lines.append(
+                f"  {RISK_STYLES[annotation.level][0]} {crd.name}: {annotation.message}"
+            )
+
+    for warning in crd_report.warnings:
+        lines.append(f"  Warning: {warning}")
+
+    if crd_report.policy_result:
+        lines.append("")
+        lines.append(f"  {crd_report.policy_result.message}")
+
+    lines.append("")
@@ -7,6 +7,8 @@ from typing import Literal
 
 import yaml
 
+from helm_preview.core.yaml_io import safe_dump, safe_load
+
 
 @dataclass
 class Resource:
@@ -44,28 +46,56 @@ def parse_multi_doc(yaml_text: str, default_namespace: str = "default") -> list[
             continue
 
         try:
-            body = yaml.safe_load(stripped)
+            body = safe_load(stripped)
         except yaml.YAMLError:
             continue
 
-        if not isinstance(body, dict):
-            continue
+        resource = _resource_from_body(body, default_namespace, stripped)
+        if resource is not None:
+            resources.append(resource)
+
+    return resources
+
 
-        # Skip non-resource docs (must have apiVersion and kind)
-        if "apiVersion" not in body or "kind" not in body:
+def expand_lists(
+    resources: list[Resource], default_namespace: str = "default"
+) -> list[Resource]:
+    """Replace `kind: List` wrappers (as printed by kubectl -o yaml) with their items."""
+    expanded: list[Resource] = []
+    for res in resources:
+        if res.kind != "List":
+            expanded.append(res)
             continue
+        for item in res.body.get("items") or []:
+            resource = _resource_from_body(item, default_namespace, None)
+            if resource is not None:
+                expanded.append(resource)
+    return expanded
 
-        metadata = body.get("metadata", {})
-        resources.append(Resource(
-            api_version=body["apiVersion"],
-            kind=body["kind"],
-            namespace=metadata.get("namespace", default_namespace),
-            name=metadata.get("name", ""),
-            body=body,
-            raw=stripped,
-        ))
 
-    return resources
+def _resource_from_body(
+    body: object, default_namespace: str, raw: str | None
+) -> Resource | None:
+    """Build a Resource from a parsed document, or None for non-resource docs.
+
+    raw defaults to a fresh YAML dump of body.
+    """
+    if not isinstance(body, dict):
+        return None
+
+    # Skip non-resource docs (must have apiVersion and kind)
+    if "apiVersion" not in body or "kind" not in body:
+        return None
+
+    metadata = body.get("metadata", {})
+    return Resource(
+        api_version=body["apiVersion"],
+        kind=body["kind"],
+        namespace=metadata.get("namespace", default_namespace),
+        name=metadata.get("name", ""),
+        body=body,
+        raw=raw if raw is not None else safe_dump(body),
+    )
 
 
 def _split_raw_docs(yaml_text: str) -> list[str]:
@@ -97,10 +127,9 @@ def pair_resources(
     old_map = {r.key: r for r in old}
     new_map = {r.key: r for r in new}
 
-    all_keys = list(dict.fromkeys(list(old_map.keys()) + list(new_map.keys())))
-
     pairs: list[ResourcePair] = []
-    for key in all_keys:
+    # Old keys first, then new ones, each in input order
+    for key in {**old_map, **new_map}:
         old_res = old_map.get(key)
         new_res = new_map.get(key)
 